@@ -1,6 +1,6 @@
 import { readClientConf, getHttpPort } from '../../lib/config.js';
 import { launchClient } from '../../lib/client.js';
-import { sendJSON, sendSSE } from '../server.js';
+import { sendJSON, formatSSE } from '../server.js';
 import {
   getClientPort, isClientRunning, isProxyReady, getClientStartedAt,
   setClientState, clearClientState, getDefaultVerbosity,
@@ -70,10 +70,11 @@ function pushEvent(event) {
   if (state.eventBuffer.length > MAX_EVENT_BUFFER) {
     state.eventBuffer.shift();
   }
-  // Broadcast to all SSE clients
+  // Broadcast to all SSE clients (serialized once, not per client)
+  const frame = formatSSE(event);
   for (const client of state.sseClients) {
     try {
-      sendSSE(client, event);
+      client.write(frame);
     } catch {
       state.sseClients.delete(client);
     }
@@ -293,10 +294,10 @@ export function register(router) {
       'Connection': 'keep-alive',
     });
 
-    // Replay last 50 events
+    // Replay last 50 events in a single write instead of one per event
     const replay = state.eventBuffer.slice(-50);
-    for (const event of replay) {
-      sendSSE(res, event);
+    if (replay.length > 0) {
+      res.write(replay.map(formatSSE).join(''));
     }
 
     state.sseClients.add(res);
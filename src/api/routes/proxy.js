@@ -11,8 +11,10 @@ const noKeepAliveAgent = new Agent({ keepAlive: false });
 
 // --- Response cache ---
 // Prevents multiple browser polls from hammering the binary concurrently.
-// Only one in-flight request per path; subsequent requests get the cached response.
+// Only one in-flight request per path; concurrent requests for the same path
+// share it, and subsequent requests get the cached response.
 const cache = new Map();  // path → { data, status, contentType, ts }
+const inflight = new Map();  // path → Promise<{ data, status, contentType }>
 const CACHE_TTL_MS = 2000;
 
 function getCached(path) {
@@ -30,67 +32,103 @@ function setCache(path, status, contentType, data) {
  */
 export function clearProxyCache() {
   cache.clear();
+  inflight.clear();
 }
 
 /**
- * Proxy a request to the client-runner HTTP API.
+ * Build http.request options for the client-runner HTTP API.
  */
-function proxyRequest(targetPort, targetPath, method, reqHeaders, reqBody, res, stream = false) {
+function requestOptions(targetPort, targetPath, method, reqHeaders, timeout) {
+  const options = {
+    hostname: '127.0.0.1',
+    port: targetPort,
+    path: targetPath,
+    method,
+    headers: { Connection: 'close' },
+    timeout,
+    agent: noKeepAliveAgent,
+  };
+
+  // Forward content-type for POST requests
+  if (reqHeaders['content-type']) {
+    options.headers['Content-Type'] = reqHeaders['content-type'];
+  }
+  return options;
+}
+
+/**
+ * GET a path from the client-runner HTTP API and buffer the response.
+ * Rejects with an error whose statusCode/message are sent to the browser.
+ */
+function fetchBuffered(targetPort, targetPath, reqHeaders) {
   return new Promise((resolve, reject) => {
-    const options = {
-      hostname: '127.0.0.1',
-      port: targetPort,
-      path: targetPath,
-      method,
-      headers: { Connection: 'close' },
-      timeout: stream ? 0 : PROXY_TIMEOUT_MS,
-      agent: noKeepAliveAgent,
-    };
-
-    // Forward content-type for POST requests
-    if (reqHeaders['content-type']) {
-      options.headers['Content-Type'] = reqHeaders['content-type'];
-    }
+    const options = requestOptions(targetPort, targetPath, 'GET', reqHeaders, PROXY_TIMEOUT_MS);
 
     const proxyReq = httpRequest(options, (proxyRes) => {
-      if (stream) {
-        // For streaming responses, pipe directly (CORS handled by main server)
-        res.writeHead(proxyRes.statusCode, {
-          'Content-Type': proxyRes.headers['content-type'] || 'text/event-stream',
-          'Cache-Control': 'no-cache',
-          'Connection': 'keep-alive',
-        });
-        proxyRes.pipe(res);
-        proxyRes.on('end', resolve);
-      } else {
-        // Buffer the response
-        const chunks = [];
-        proxyRes.on('data', (chunk) => chunks.push(chunk));
-        proxyRes.on('end', () => {
-          const body = Buffer.concat(chunks).toString();
-          const ct = proxyRes.headers['content-type'] || 'application/json';
-
-          // Cache successful GET responses
-          if (method === 'GET' && proxyRes.statusCode < 400) {
-            setCache(targetPath, proxyRes.statusCode, ct, body);
-          }
-
-          res.writeHead(proxyRes.statusCode, {
-            'Content-Type': ct,
-            'Cache-Control': 'no-store',
-          });
-          res.end(body);
-          resolve();
-        });
-      }
+      const chunks = [];
+      proxyRes.on('data', (chunk) => chunks.push(chunk));
+      proxyRes.on('end', () => {
+        const data = Buffer.concat(chunks).toString();
+        const contentType = proxyRes.headers['content-type'] || 'application/json';
+
+        // Cache successful responses
+        if (proxyRes.statusCode < 400) {
+          setCache(targetPath, proxyRes.statusCode, contentType, data);
+        }
+        resolve({ status: proxyRes.statusCode, contentType, data });
+      });
+      // Socket closed mid-body (no 'end'): settle now, otherwise the
+      // in-flight entry would stall every later poll of this path.
+      proxyRes.on('error', () => {});
+      proxyRes.on('close', () => {
+        if (!proxyRes.complete) reject(unreachable('connection closed mid-response'));
+      });
     });
 
     proxyReq.on('timeout', () => {
+      const err = new Error('Client not ready (timeout)');
+      err.statusCode = 504;
+      reject(err);
       proxyReq.destroy();
-      if (!res.headersSent) {
-        sendJSON(res, 504, { error: 'Client not ready (timeout)' });
-      }
-      reject(new Error('proxy timeout'));
+    });
+
+    proxyReq.on('error', (err) => {
+      // No-op if the timeout handler already rejected
+      reject(unreachable(err.message));
+    });
+
+    // Closed before any response arrived, without an 'error' (no-op if
+    // already settled). Once headers are in, the proxyRes handlers decide.
+    proxyReq.on('close', () => {
+      if (!proxyReq.res) reject(unreachable('connection closed'));
+    });
+
+    proxyReq.end();
+  });
+}
+
+function unreachable(reason) {
+  const err = new Error(`Client unreachable: ${reason}`);
+  err.statusCode = 502;
+  return err;
+}
+
+/**
+ * Stream a request to the client-runner HTTP API straight into the response.
+ */
+function proxyStream(targetPort, targetPath, method, reqHeaders, reqBody, res) {
+  return new Promise((resolve, reject) => {
+    const options = requestOptions(targetPort, targetPath, method, reqHeaders, 0);
+
+    const proxyReq = httpRequest(options, (proxyRes) => {
+      // Pipe directly (CORS handled by main server)
+      res.writeHead(proxyRes.statusCode, {
+        'Content-Type': proxyRes.headers['content-type'] || 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'Connection': 'keep-alive',
+      });
+      proxyRes.pipe(res);
+      proxyRes.on('end', resolve);
     });
 
     proxyReq.on('error', (err) => {
@@ -112,17 +150,30 @@ function proxyRequest(targetPort, targetPath, method, reqHeaders, reqBody, res,
 /**
  * Serve from cache or proxy to binary (one request at a time per path).
  */
-function cachedProxy(port, path, reqHeaders, res) {
-  const cached = getCached(path);
-  if (cached) {
-    res.writeHead(cached.status, {
-      'Content-Type': cached.contentType,
-      'Cache-Control': 'no-store',
-    });
-    res.end(cached.data);
-    return Promise.resolve();
+async function cachedProxy(port, path, reqHeaders, res) {
+  let entry = getCached(path);
+  if (!entry) {
+    let pending = inflight.get(path);
+    if (!pending) {
+      pending = fetchBuffered(port, path, reqHeaders).finally(() => {
+        if (inflight.get(path) === pending) inflight.delete(path);
+      });
+      inflight.set(path, pending);
+    }
+    try {
+      entry = await pending;
+    } catch (err) {
+      if (!res.headersSent) {
+        sendJSON(res, err.statusCode || 502, { error: err.message });
+      }
+      throw err;
+    }
   }
-  return proxyRequest(port, path, 'GET', reqHeaders, null, res);
+  res.writeHead(entry.status, {
+    'Content-Type': entry.contentType,
+    'Cache-Control': 'no-store',
+  });
+  res.end(entry.data);
 }
 
 export function register(router) {
@@ -146,7 +197,7 @@ export function register(router) {
     try {
       await cachedProxy(port, '/jsonstats', req.headers, res);
     } catch {
-      // Error already sent in proxyRequest
+      // Error already sent to the browser
     }
   });
 
@@ -167,7 +218,7 @@ export function register(router) {
     try {
       await cachedProxy(port, '/v1/models', req.headers, res);
     } catch {
-      // Error already sent in proxyRequest
+      // Error already sent to the browser
     }
   });
 
@@ -182,9 +233,9 @@ export function register(router) {
       return;
     }
     try {
-      await proxyRequest(port, '/v1/chat/completions', 'POST', req.headers, body, res, true);
+      await proxyStream(port, '/v1/chat/completions', 'POST', req.headers, body, res);
     } catch {
-      // Error already sent in proxyRequest
+      // Error already sent to the browser
     }
   });
 }
@@ -1,6 +1,6 @@
 import { createServer as httpCreateServer } from 'http';
 import { readFileSync, statSync } from 'fs';
-import { resolve, extname, join } from 'path';
+import { resolve, extname, join, sep } from 'path';
 import { fileURLToPath } from 'url';
 import { dirname } from 'path';
 import { randomUUID } from 'crypto';
@@ -8,6 +8,7 @@ import { apiLogger } from '../lib/logger.js';
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
 const WEBUI_DIST = resolve(__dirname, '../../webui/dist');
+const WEBUI_ASSETS = join(WEBUI_DIST, 'assets') + sep;
 
 const MIME_TYPES = {
   '.html': 'text/html',
@@ -25,6 +26,9 @@ const MIME_TYPES = {
 
 const MAX_BODY_SIZE = 1048576; // 1 MB
 
+// Origins allowed by CORS: the WebUI itself or a local dev server
+const LOCAL_ORIGIN_RE = /^http:\/\/(127\.0\.0\.1|localhost)(:\d+)?$/;
+
 /**
  * Parse JSON body from request.
  */
@@ -69,32 +73,33 @@ export function sendJSON(res, statusCode, data) {
 }
 
 /**
- * Send SSE event.
+ * Format data as an SSE frame. Serialize once when writing to many clients.
  */
-export function sendSSE(res, data) {
-  res.write(`data: ${JSON.stringify(data)}\n\n`);
+export function formatSSE(data) {
+  return `data: ${JSON.stringify(data)}\n\n`;
 }
 
 /**
  * Create a simple router with method+path matching supporting :params.
  */
 export function createRouter() {
-  const routes = [];
+  // Routes bucketed by method so a lookup only scans candidates for that verb
+  const routes = new Map();  // method → [{ regex, paramNames, handler }]
 
   function addRoute(method, path, handler) {
-    // Convert path pattern to regex
+    // Convert path pattern to regex (compiled once, at registration)
     const paramNames = [];
     const pattern = path.replace(/:([^/]+)/g, (_, name) => {
       paramNames.push(name);
       return '([^/]+)';
     });
     const regex = new RegExp(`^${pattern}$`);
-    routes.push({ method, regex, paramNames, handler });
+    if (!routes.has(method)) routes.set(method, []);
+    routes.get(method).push({ regex, paramNames, handler });
   }
 
   function match(method, pathname) {
-    for (const route of routes) {
-      if (route.method !== method) continue;
+    for (const route of routes.get(method) || []) {
       const m = pathname.match(route.regex);
       if (m) {
         const params = {};
@@ -116,6 +121,11 @@ export function createRouter() {
   };
 }
 
+// Hashed build assets never change for a given filename, so keep them in
+// memory instead of stat+read from disk on every request.
+const assetCache = new Map();  // absolute path → { content, contentType }
+const IMMUTABLE_CACHE_HEADER = 'public, max-age=31536000, immutable';
+
 /**
  * Serve static files from webui/dist with SPA fallback.
  */
@@ -132,6 +142,13 @@ function serveStatic(req, res) {
     return;
   }
 
+  const cached = assetCache.get(filePath);
+  if (cached) {
+    res.writeHead(200, { 'Content-Type': cached.contentType, 'Cache-Control': IMMUTABLE_CACHE_HEADER });
+    res.end(cached.content);
+    return;
+  }
+
   try {
     const stat = statSync(filePath);
     if (!stat.isFile()) throw new Error('not a file');
@@ -150,9 +167,9 @@ function serveStatic(req, res) {
   try {
     const content = readFileSync(filePath);
     // Hashed filenames (assets/) get long cache, HTML gets no-cache
-    const cacheHeader = filePath.includes('/assets/')
-      ? 'public, max-age=31536000, immutable'
-      : 'no-cache';
+    const immutable = filePath.startsWith(WEBUI_ASSETS);
+    if (immutable) assetCache.set(filePath, { content, contentType });
+    const cacheHeader = immutable ? IMMUTABLE_CACHE_HEADER : 'no-cache';
     res.writeHead(200, { 'Content-Type': contentType, 'Cache-Control': cacheHeader });
     res.end(content);
   } catch {
@@ -165,7 +182,7 @@ function serveStatic(req, res) {
  */
 function setCorsHeaders(req, res) {
   const origin = req.headers.origin;
-  if (origin && /^http:\/\/(127\.0\.0\.1|localhost)(:\d+)?$/.test(origin)) {
+  if (origin && LOCAL_ORIGIN_RE.test(origin)) {
     res.setHeader('Access-Control-Allow-Origin', origin);
     res.setHeader('Vary', 'Origin');
   }
@@ -1,13 +1,9 @@
 #!/usr/bin/env node
 import { Command } from 'commander';
-import { setupCommand } from './commands/setup.js';
-import { startCommand } from './commands/start.js';
-import { statusCommand } from './commands/status.js';
-import { modelsCommand } from './commands/models.js';
-import { withdrawCommand } from './commands/withdraw.js';
-import { unstakeCommand } from './commands/unstake.js';
-import { cashoutCommand } from './commands/cashout.js';
-import { uiCommand } from './commands/ui.js';
+
+// Command modules are imported on demand so each invocation only loads
+// what it runs (e.g. `status` skips @ton/ton, inquirer and the API server).
+const lazy = (path, name) => async (...args) => (await import(path))[name](...args);
 
 const program = new Command();
 
@@ -19,51 +15,51 @@ program
 program
   .command('setup')
   .description('Interactive setup wizard — configure wallet and client')
-  .action(setupCommand);
+  .action(lazy('./commands/setup.js', 'setupCommand'));
 
 program
   .command('start')
   .description('Start the COCOON client (router + client-runner)')
   .option('--verbosity <level>', 'Client verbosity level (0-5)', '1')
   .option('--router-policy <policy>', 'Router TEE policy (tdx, any)', 'any')
-  .action(startCommand);
+  .action(lazy('./commands/start.js', 'startCommand'));
 
 program
   .command('status')
   .description('Show client status, balance, and stats')
   .option('-p, --port <port>', 'Client HTTP port (auto-detected from client.conf)')
-  .action(statusCommand);
+  .action(lazy('./commands/status.js', 'statusCommand'));
 
 program
   .command('models')
   .description('List available AI models')
   .option('-p, --port <port>', 'Client HTTP port (auto-detected from client.conf)')
-  .action(modelsCommand);
+  .action(lazy('./commands/models.js', 'modelsCommand'));
 
 program
   .command('withdraw')
   .description('Withdraw TON from cocoon wallet to owner wallet')
   .argument('[amount]', 'Amount in TON or "max" (default: max)')
-  .action(withdrawCommand);
+  .action(lazy('./commands/withdraw.js', 'withdrawCommand'));
 
 program
   .command('unstake')
   .description('Unstake TON — close proxy contract and withdraw funds')
   .option('-p, --port <port>', 'Client HTTP port (auto-detected from client.conf)')
-  .action(unstakeCommand);
+  .action(lazy('./commands/unstake.js', 'unstakeCommand'));
 
 program
   .command('cashout')
   .description('Send TON from owner wallet to an external address')
   .argument('<amount>', 'Amount in TON or "max" to send all')
   .argument('<address>', 'Destination wallet address')
-  .action(cashoutCommand);
+  .action(lazy('./commands/cashout.js', 'cashoutCommand'));
 
 program
   .command('ui')
   .description('Launch web management UI')
   .option('-p, --port <number>', 'Port for web UI', '3000')
   .option('--verbosity <level>', 'Client verbosity level (0-5)', '1')
-  .action((opts) => uiCommand(opts));
+  .action(lazy('./commands/ui.js', 'uiCommand'));
 
-program.parse();
+await program.parseAsync();
@@ -8,16 +8,31 @@ import {
 import { spawnWithPrefix, setupSignalHandlers } from './process.js';
 import { RED } from './ui.js';
 
+// "$VAR" (JSON string) or bare $VAR; the full name is matched greedily so
+// $PORT can never clobber the prefix of $PORT_RPC.
+const TEMPLATE_VAR_RE = /"\$(\w+)"|\$(\w+)/g;
+
+/**
+ * Replace $VAR placeholders in template content with runtime vars.
+ * Single pass over the template instead of two full scans per variable;
+ * unknown $VARs are left untouched and values are inserted literally.
+ * @param {string} content
+ * @param {Record<string, unknown>} vars
+ * @returns {string}
+ */
+export function renderTemplateString(content, vars) {
+  return content.replace(TEMPLATE_VAR_RE, (match, quoted, bare) => {
+    const key = quoted ?? bare;
+    if (!Object.hasOwn(vars, key)) return match;
+    return quoted !== undefined ? JSON.stringify(vars[key]) : String(vars[key]);
+  });
+}
+
 /**
- * Render a JSON template by replacing $VAR placeholders with runtime vars
+ * Render a JSON template file by replacing $VAR placeholders with runtime vars
  */
 function renderTemplate(templatePath, vars) {
-  let content = readFileSync(templatePath, 'utf-8');
-  for (const [key, value] of Object.entries(vars)) {
-    content = content.replaceAll(`"$${key}"`, JSON.stringify(value));
-    content = content.replaceAll(`$${key}`, String(value));
-  }
-  return content;
+  return renderTemplateString(readFileSync(templatePath, 'utf-8'), vars);
 }
 
 /**
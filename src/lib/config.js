@@ -1,4 +1,4 @@
-import { readFileSync, writeFileSync, existsSync, mkdirSync, chmodSync } from 'fs';
+import { readFileSync, writeFileSync, existsSync, mkdirSync, chmodSync, statSync } from 'fs';
 import { resolve, dirname } from 'path';
 import { fileURLToPath } from 'url';
 
@@ -18,11 +18,27 @@ export const PATHS = {
 
 const DEFAULT_ROOT_CONTRACT = 'EQCns7bYSp0igFvS1wpb5wsZjCKCV19MD5AVzI4EyxsnU73k';
 
+// Parsed client.conf per path, keyed by mtime+size. getApiKey() runs on
+// every Toncenter query and the WebUI polls several routes that read the
+// config, so re-parsing an unchanged file each time is pure waste.
+const confCache = new Map();  // path → { mtimeMs, size, config }
+
 /**
  * Parse INI-style client.conf
  */
 export function readClientConf(path = PATHS.clientConf) {
-  if (!existsSync(path)) return null;
+  let stat;
+  try {
+    stat = statSync(path);
+  } catch {
+    confCache.delete(path);
+    return null;
+  }
+  const cached = confCache.get(path);
+  if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+    return { ...cached.config };
+  }
+
   const content = readFileSync(path, 'utf-8');
   const config = {};
   for (const line of content.split('\n')) {
@@ -34,7 +50,8 @@ export function readClientConf(path = PATHS.clientConf) {
     const val = trimmed.slice(eqIdx + 1).trim();
     config[key] = val;
   }
-  return config;
+  confCache.set(path, { mtimeMs: stat.mtimeMs, size: stat.size, config });
+  return { ...config };
 }
 
 /**
@@ -48,6 +65,7 @@ export function writeClientConf(config, path = PATHS.clientConf) {
   }
   writeFileSync(path, lines.join('\n') + '\n');
   chmodSync(path, 0o600);
+  confCache.delete(path);
 }
 
 /**
@@ -37,6 +37,9 @@ const WARNING_PATTERNS = [
   },
 ];
 
+// Port number in the binary's TcpListener line
+const LISTEN_PORT_RE = /port:(\d+)/;
+
 // Lifecycle events from process.js patterns
 const LIFECYCLE_MESSAGES = {
   ton_synced: 'TON blockchain synced',
@@ -47,6 +50,9 @@ const LIFECYCLE_MESSAGES = {
   listening: null, // handled separately
 };
 
+// Events synthesized by client.js (not parsed from binary output)
+const SYNTHESIZED_EVENTS = new Set(['exit', 'starting', 'stopping', 'stopped']);
+
 // Track dedup state
 const seenWarnings = new Set();
 
@@ -54,7 +60,7 @@ export function classifyEvent(event, data) {
   const timestamp = Date.now();
 
   // Handle synthesized events from client.js
-  if (event === 'exit' || event === 'starting' || event === 'stopping' || event === 'stopped') {
+  if (SYNTHESIZED_EVENTS.has(event)) {
     return { type: event, level: 'info', message: data?.message || event, category: 'lifecycle', timestamp };
   }
 
@@ -66,7 +72,7 @@ export function classifyEvent(event, data) {
     let message = LIFECYCLE_MESSAGES[event];
     if (event === 'listening') {
       const raw = Array.isArray(data) ? data[0] : '';
-      const portMatch = raw.match?.(/port:(\d+)/);
+      const portMatch = raw.match?.(LISTEN_PORT_RE);
       message = portMatch ? `Listening on port ${portMatch[1]}` : 'Listener started';
     }
     return { type: event, level: 'info', message, category: 'lifecycle', timestamp };
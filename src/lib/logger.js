@@ -2,7 +2,13 @@ import pino from 'pino';
 
 const isWebUI = process.env.COCOON_MODE === 'webui';
 
-// Base logger config
+// Base logger config.
+// By default logs are formatted by the pino-pretty transport (worker thread),
+// including under `cocoon ui`. When COCOON_MODE=webui is set in the
+// environment (headless/container use), raw JSON goes to stdout through an
+// async buffered destination instead, so request handlers and the
+// child-process event path never block on a write syscall; pino flushes the
+// buffer synchronously on process exit.
 const logger = pino({
   level: process.env.LOG_LEVEL || 'info',
   formatters: {
@@ -19,7 +25,7 @@ const logger = pino({
       },
     },
   }),
-});
+}, isWebUI ? pino.destination({ dest: 1, sync: false }) : undefined);
 
 export default logger;
 
@@ -6,6 +6,9 @@ let shuttingDown = false;
 let signalHandlersRegistered = false;
 let currentCleanup = null;
 
+// ANSI color/style escape sequences, stripped before pattern matching
+const ANSI_RE = /\x1b\[[0-9;]*m/g;
+
 // Patterns to detect lifecycle events from binary output
 const LIFECYCLE_PATTERNS = [
   { pattern: /TonLib is synced/, event: 'ton_synced', message: 'TON blockchain synced' },
@@ -39,10 +42,11 @@ export function spawnWithPrefix(cmd, args, { prefix, color, env = {}, quiet = fa
     if (!line.trim()) return;
 
     // Strip ANSI codes for pattern matching
-    const clean = line.replace(/\x1b\[[0-9;]*m/g, '');
+    const clean = line.replace(ANSI_RE, '');
+    const text = clean.trim();
 
     // Always keep last lines for exit diagnostics
-    lastLines.push(clean.trim());
+    lastLines.push(text);
     if (lastLines.length > MAX_LAST_LINES) lastLines.shift();
 
     // Check lifecycle patterns
@@ -53,7 +57,7 @@ export function spawnWithPrefix(cmd, args, { prefix, color, env = {}, quiet = fa
 
         if (lp.event === 'fatal' || lp.event === 'error') {
           // Always show errors
-          process.stderr.write(`${tag} ${chalk.red(clean.trim())}\n`);
+          process.stderr.write(`${tag} ${chalk.red(text)}\n`);
           return;
         }
 
@@ -65,7 +69,7 @@ export function spawnWithPrefix(cmd, args, { prefix, color, env = {}, quiet = fa
     // In quiet mode, forward non-lifecycle lines as 'log' events
     // so the WebUI Event Log can display them at higher verbosity.
     if (quiet) {
-      if (onEvent) onEvent('log', [clean.trim()]);
+      if (onEvent) onEvent('log', [text]);
       return;
     }
 
@@ -76,8 +80,11 @@ export function spawnWithPrefix(cmd, args, { prefix, color, env = {}, quiet = fa
 
   for (const stream of ['stdout', 'stderr']) {
     let buffer = '';
+    // Decode in the stream (StringDecoder) so multi-byte UTF-8 characters
+    // split across pipe chunks are not mangled by per-chunk toString().
+    proc[stream].setEncoding('utf8');
     proc[stream].on('data', (data) => {
-      buffer += data.toString();
+      buffer += data;
       const lines = buffer.split('\n');
       buffer = lines.pop(); // keep incomplete line
       for (const line of lines) {
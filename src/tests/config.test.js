@@ -85,6 +85,25 @@ describe('readClientConf / writeClientConf roundtrip', () => {
     assert.equal(output.some_key, 'value=with=equals');
   });
 
+  it('picks up changes made to the file after a previous read', () => {
+    writeClientConf({ instance: '0' }, tempConf);
+    assert.equal(readClientConf(tempConf).instance, '0');
+
+    // Edited outside writeClientConf (e.g. by hand) — must not serve stale data
+    writeFileSync(tempConf, '[node]\ntype = client\ninstance = 12\n');
+    assert.equal(readClientConf(tempConf).instance, '12');
+
+    writeClientConf({ instance: '5' }, tempConf);
+    assert.equal(readClientConf(tempConf).instance, '5');
+  });
+
+  it('returns a copy that callers can mutate safely', () => {
+    writeClientConf({ instance: '0' }, tempConf);
+    const first = readClientConf(tempConf);
+    first.instance = '9';
+    assert.equal(readClientConf(tempConf).instance, '0');
+  });
+
   it('creates the file with restricted permissions', () => {
     writeClientConf({ instance: '0' }, tempConf);
     assert.ok(existsSync(tempConf), 'conf file should exist after write');
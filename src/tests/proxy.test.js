@@ -0,0 +1,97 @@
+import { describe, it, before, after, beforeEach } from 'node:test';
+import assert from 'node:assert/strict';
+import { createServer } from 'http';
+import { register, clearProxyCache } from '../api/routes/proxy.js';
+import { setClientState, setProxyReady, clearClientState } from '../services/client-state.js';
+
+function listen(server) {
+  return new Promise((resolve) => server.listen(0, '127.0.0.1', () => resolve(server.address().port)));
+}
+
+function close(server) {
+  server.closeAllConnections();
+  return new Promise((resolve) => server.close(resolve));
+}
+
+describe('proxy /api/jsonstats in-flight coalescing', () => {
+  let upstream;
+  let front;
+  let frontPort;
+  let hits = 0;
+  // How the fake client-runner answers the current request
+  let respond = (res) => res.end('{}');
+
+  before(async () => {
+    upstream = createServer((req, res) => {
+      hits++;
+      respond(res);
+    });
+    setClientState(await listen(upstream));
+    setProxyReady();
+
+    const routes = {};
+    register({ get: (path, handler) => { routes[path] = handler; }, post: () => {} });
+    front = createServer((req, res) => routes['/api/jsonstats']({ req, res }));
+    frontPort = await listen(front);
+  });
+
+  after(async () => {
+    clearClientState();
+    clearProxyCache();
+    await close(front);
+    await close(upstream);
+  });
+
+  beforeEach(() => {
+    clearProxyCache();
+    hits = 0;
+  });
+
+  const get = async () => {
+    const res = await fetch(`http://127.0.0.1:${frontPort}/api/jsonstats`);
+    return { status: res.status, body: await res.json() };
+  };
+
+  it('shares one upstream request between concurrent callers', async () => {
+    respond = (res) => setTimeout(() => {
+      res.writeHead(200, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify({ hit: hits }));
+    }, 100);
+
+    const results = await Promise.all([get(), get(), get(), get()]);
+
+    assert.equal(hits, 1);
+    for (const r of results) {
+      assert.equal(r.status, 200);
+      assert.deepEqual(r.body, { hit: 1 });
+    }
+  });
+
+  it('rejects every waiter with 502 when upstream disconnects mid-body', async () => {
+    respond = (res) => {
+      res.writeHead(200, { 'Content-Type': 'application/json', 'Content-Length': '100' });
+      res.write('{"partial":');
+      setTimeout(() => res.socket.destroy(), 100);
+    };
+
+    const started = Date.now();
+    const results = await Promise.all([get(), get(), get()]);
+
+    assert.equal(hits, 1);
+    assert.ok(Date.now() - started < 2000, 'settles on disconnect, not on the 5s timeout');
+    for (const r of results) {
+      assert.equal(r.status, 502);
+      assert.match(r.body.error, /Client unreachable/);
+    }
+
+    // The failed request must not stay in flight for later polls
+    respond = (res) => {
+      res.writeHead(200, { 'Content-Type': 'application/json' });
+      res.end('{"ok":true}');
+    };
+    const next = await get();
+    assert.equal(next.status, 200);
+    assert.deepEqual(next.body, { ok: true });
+    assert.equal(hits, 2);
+  });
+});